@@ -1,11 +1,7 @@
-import glob
 import itertools
-import os
 import shutil
 from pathlib import Path
 
-import yaml
-
 from spikewrap.process import _preprocessing
 from spikewrap.utils import _utils
 
@@ -33,12 +29,11 @@ def get_configs(name: str) -> tuple[dict, dict]:
         a dictionary of kwargs to pass to the
         spikeinterface sorter class.
     """
-    config_dir = get_configs_path()
-
-    available_files = glob.glob((config_dir / "*.yaml").as_posix())
-    available_files = [Path(path_).stem for path_ in available_files]
+    config_filepath = get_configs_path() / f"{name}.yaml"
 
-    if name not in available_files:
+    # Only bare names are looked up in the configs folder, so that
+    # absolute paths or `..` cannot resolve outside of it.
+    if Path(name).name != name or not config_filepath.is_file():
         # then assume it is a full path
 
         assert Path(name).is_file(), (
@@ -53,11 +48,7 @@ def get_configs(name: str) -> tuple[dict, dict]:
 
         config_filepath = Path(name)
 
-    else:
-        config_filepath = config_dir / f"{name}.yaml"
-
-    with open(config_filepath) as file:
-        config = yaml.full_load(file)
+    config = _utils._load_dict_from_yaml(config_filepath)
 
     pp_steps = config.get("preprocessing", {})
     sorting = config.get("sorting", {})
@@ -95,11 +86,7 @@ def _create_user_configs_folder(configs_path: Path) -> None:
     """
     configs_path.mkdir(parents=True)
 
-    default_configs_path = (
-        Path(os.path.dirname(os.path.realpath(__file__)))
-        / "_backend"
-        / "_default_configs"
-    )
+    default_configs_path = Path(__file__).parent / "_backend" / "_default_configs"
     for config_filepath in list(
         default_configs_path.glob("*.yaml")
     ):  # TODO: store canon suffix
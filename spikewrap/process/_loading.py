@@ -3,17 +3,20 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Literal
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from spikeinterface.core import BaseRecording
 
+import fnmatch
+import os
 import re
 import warnings
+from pathlib import Path
 
 import spikeinterface.full as si
 
 from spikewrap.utils import _utils
 
+_IMEC_ID_REGEX = re.compile(r".*_imec(\d+)$")
+
 
 def load_data(
     run_path: Path, file_format: Literal["spikeglx", "openephys"]
@@ -111,7 +114,7 @@ def get_run_paths(
     if passed_run_names == "all":
         run_paths = detected_run_paths
     else:
-        detected_run_names = [path_.name for path_ in detected_run_paths]
+        detected_run_names = {path_.name for path_ in detected_run_paths}
 
         for passed_name in passed_run_names:
             if passed_name not in detected_run_names:
@@ -148,14 +151,12 @@ def get_spikeglx_runs(ses_path: Path) -> list[Path]:
     list of Path
         A list of validated run paths, each contain one recording.
     """
-    detected_run_paths = [
-        path_ for path_ in ses_path.glob("*g*_imec*") if path_.is_dir()
-    ]
+    detected_run_paths = _get_matching_folders(ses_path, "*g*_imec*")
 
     # Currently, only imec0 supported
     for path_ in detected_run_paths:
         putative_imec_id = path_.name.split("-")[-1]
-        match = re.compile(r".*_imec(\d+)$").match(putative_imec_id)
+        match = _IMEC_ID_REGEX.match(putative_imec_id)
 
         if match and match.group(1) != "0":
             raise RuntimeError(
@@ -226,9 +227,7 @@ def get_openephys_runs(ses_path: Path) -> list[Path]:
             f"No 'experiment' openephys recordings found at {node_path}."
         )
 
-    detected_run_paths = [
-        path_ for path_ in experiment_path[0].glob("*recording*") if path_.is_dir()
-    ]
+    detected_run_paths = _get_matching_folders(experiment_path[0], "*recording*")
 
     for path_ in detected_run_paths:
         rec_paths = list(path_.glob("*continuous*"))
@@ -236,3 +235,34 @@ def get_openephys_runs(ses_path: Path) -> list[Path]:
             raise RuntimeError(f"No 'continuous' recording found in run path: {path_}")
 
     return detected_run_paths
+
+
+def _get_matching_folders(parent_path: Path, pattern: str) -> list[Path]:
+    """
+    Get all folders directly within ``parent_path`` with a name
+    matching the glob-style ``pattern``.
+
+    The parent folder is read once with ``os.scandir``, whose entries
+    report if they are a directory without a ``stat`` call per path.
+
+    Parameters
+    ----------
+    parent_path
+        The path to the folder to search.
+    pattern
+        Glob-style pattern that folder names must match.
+
+    Returns
+    -------
+    list of Path
+        Paths to the matching folders. Empty if ``parent_path`` does not exist.
+    """
+    try:
+        with os.scandir(parent_path) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if fnmatch.fnmatch(entry.name, pattern) and entry.is_dir()
+            ]
+    except FileNotFoundError:
+        return []
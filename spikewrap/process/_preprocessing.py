@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import Callable
 
-import numpy as np
 import spikeinterface.full as si
 
 from spikewrap.utils import _utils
@@ -101,12 +100,11 @@ def _validate_pp_steps(pp_steps: dict) -> None:
 
     key_nums = [int(key) for key in pp_steps.keys()]
 
-    assert np.min(key_nums) == 1, "dict keys must start at 1"
+    assert min(key_nums) == 1, "dict keys must start at 1"
 
-    if len(key_nums) > 1:
-        diffs = np.diff(key_nums)
-        assert np.unique(diffs).size == 1, "all dict keys must increase in steps of 1"
-        assert diffs[0] == 1, "all dict keys must increase in steps of 1"
+    assert all(
+        next_num - num == 1 for num, next_num in zip(key_nums, key_nums[1:])
+    ), "all dict keys must increase in steps of 1"
 
 
 def _get_pp_funcs() -> dict[str, Callable]:
@@ -528,7 +528,7 @@ class ConcatRun(BaseRun):
         all_sampling_frequency = [
             rec["grouped"].get_sampling_frequency() for rec in raw_data
         ]
-        if not np.unique(all_sampling_frequency).size == 1:
+        if len(set(all_sampling_frequency)) != 1:
             raise RuntimeError(
                 f"Cannot concatenate recordings with different sampling frequencies."
                 f"This occurred for runs in folder: {self._parent_input_path}"
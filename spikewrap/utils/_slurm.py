@@ -1,5 +1,6 @@
 import datetime
-import subprocess
+import functools
+import shutil
 from pathlib import Path
 from typing import Callable
 
@@ -9,7 +10,6 @@ from spikewrap.configs.hpc import (
     default_slurm_options,
 )
 from spikewrap.utils import _utils
-from spikewrap.utils._checks import _system_call_success
 
 
 def run_in_slurm(
@@ -45,13 +45,18 @@ def run_in_slurm(
     should_wait = used_slurm_opts.pop("wait")
     env_name = used_slurm_opts.pop("env_name")
 
+    # Environment setup runs before any user-provided setup lines.
+    user_setup = used_slurm_opts.get("slurm_setup", [])
+    if isinstance(user_setup, str):
+        user_setup = [user_setup]
+
+    used_slurm_opts["slurm_setup"] = get_env_setup_commands(env_name) + list(user_setup)
+
     log_path = make_job_log_output_path(log_base_path)
 
     executor = get_executor(log_path, used_slurm_opts)
 
-    job = executor.submit(
-        wrap_function_with_env_setup, func_to_run, env_name, func_opts
-    )
+    job = executor.submit(wrap_function_with_message, func_to_run, func_opts)
 
     if should_wait:
         job.wait()
@@ -91,35 +96,43 @@ def get_executor(log_path: Path, slurm_opts: dict) -> submitit.AutoExecutor:
     return executor
 
 
-def wrap_function_with_env_setup(
-    function: Callable, env_name: str, func_opts: dict
-) -> None:
+def get_env_setup_commands(env_name: str) -> list[str]:
     """
-    Set up the environment from within the SLURM job,
-    prior to running the processing function.
+    Return the shell commands that set up the environment for the SLURM job.
 
-    This is required to set up the conda environment within the job
+    These are passed to ``submitit`` as ``slurm_setup`` and written into the
+    sbatch script, so they run in the job shell before the processing function
+    is started. This is required to set up the conda environment within the job
     or the processing function will fail.
 
     Parameters
     ----------
-    function
-        A function to run in the SLURM job.
-
     env_name
         The name of the conda environment to run the job in
 
+    Returns
+    -------
+    setup_commands
+        The list of commands, run in order, to set up the job environment.
+    """
+    return ["module load miniconda", f"source activate {env_name}", "module load cuda"]
+
+
+def wrap_function_with_message(function: Callable, func_opts: dict) -> None:
+    """
+    Run the processing function from within the SLURM job,
+    printing a message to the job output log first.
+
+    Parameters
+    ----------
+    function
+        A function to run in the SLURM job.
+
     func_opts
         All arguments passed to the public function.
     """
     print(f"\nrunning {function.__name__} with SLURM....\n")
 
-    subprocess.run(
-        f"module load miniconda; " f"source activate {env_name}; module load cuda",
-        executable="/bin/bash",
-        shell=True,
-    )
-
     function(**func_opts)
 
 
@@ -178,6 +191,13 @@ def send_user_start_message(
     )
 
 
-def is_slurm_installed():
-    slurm_installed = _system_call_success("sinfo -v")
+@functools.lru_cache(maxsize=1)
+def is_slurm_installed() -> bool:
+    """
+    Return ``True`` if SLURM is available on this system.
+
+    Checks for ``sinfo`` on the PATH rather than calling it,
+    the result is cached as it cannot change during the process.
+    """
+    slurm_installed = shutil.which("sinfo") is not None
     return slurm_installed
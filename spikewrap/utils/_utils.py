@@ -1,19 +1,40 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     from spikeinterface.core import BaseRecording
 
-import copy
 import json
 import os
 
-import numpy as np
 import yaml
 
+# Use the libyaml C implementation where PyYAML was built with it,
+# it is substantially faster than the pure-Python loader / dumper.
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+
+class _ConfigLoader(_YamlLoader):
+    """
+    Safe YAML loader that also reads `!!python/tuple` values (as lists).
+    These were written by `yaml.dump` in older versions of spikewrap.
+    """
+
+
+def _construct_python_tuple(loader: _ConfigLoader, node: yaml.SequenceNode) -> list:
+    return loader.construct_sequence(node, deep=True)
+
+
+_ConfigLoader.add_constructor("tag:yaml.org,2002:python/tuple", _construct_python_tuple)
+
 
 def message_user(message: str) -> None:
     """
@@ -59,50 +80,27 @@ def _get_dict_value_from_step_num(
         The key of the preprocessing dict associated with the step number.
     """
     if step_num == "last":
-        pp_key_nums = _get_keys_first_char(data, as_int=True)
-
-        # Complete overkill as a check but this is critical.
-        step_num = str(int(np.max(pp_key_nums)))
-        assert (
-            int(step_num) == len(data.keys()) - 1
+        # Steps are added to the dict in order, so the last step is the last key.
+        pp_key = next(reversed(data))
+
+        # Complete overkill as a check but this is critical. The step numbers
+        # must run 0, 1, ..., n - 1 so the last key is the unique final step.
+        step_nums = [int(key.partition("-")[0]) for key in data]
+        assert step_nums == list(
+            range(len(data))
         ), "the last key has been taken incorrectly"
+    else:
+        select_step_pp_key = [key for key in data if key.partition("-")[0] == step_num]
 
-    select_step_pp_key = [key for key in data.keys() if key.split("-")[0] == step_num]
+        assert len(select_step_pp_key) == 1, "pp_key must always have unique first char"
 
-    assert len(select_step_pp_key) == 1, "pp_key must always have unique first char"
+        pp_key = select_step_pp_key[0]
 
-    pp_key: str = select_step_pp_key[0]
     recording = data[pp_key]
 
     return recording, pp_key
 
 
-# TODO: should overload
-def _get_keys_first_char(data: dict, as_int: bool = False) -> list[str] | list[int]:
-    """
-    Get the first character of all keys in a dictionary.
-    Expected that the first characters are integers (as str type).
-
-    Parameters
-    ----------
-    data
-        The `Preprocessed._data` dict containing preprocessing steps and recordings.
-
-    as_int
-        If True, the first character of the keys are cast to integer type.
-
-    Returns
-    -------
-    list_of_numbers
-        A list of numbers of string or integer type, that are
-        the first numbers of the data dictionary keys.
-    """
-    list_of_numbers = [
-        int(key.split("-")[0]) if as_int else key.split("-")[0] for key in data.keys()
-    ]
-    return list_of_numbers
-
-
 def _paths_are_in_datetime_order(
     list_of_paths: list[Path], creation_or_modification: str = "creation"
 ) -> bool:
@@ -132,15 +130,17 @@ def _paths_are_in_datetime_order(
         "modification",
     ], "creation_or_modification must be 'creation' or 'modification."
 
-    filter: Callable
-    filter = (
-        os.path.getctime if creation_or_modification == "creation" else os.path.getmtime
-    )
+    # A single path (e.g. a session with one run) is trivially in order.
+    if len(list_of_paths) < 2:
+        return True
+
+    # Stat each path exactly once, then check the times are non-decreasing.
+    # This is equivalent to comparing against a (stable) sorted copy.
+    stat_field = "st_ctime" if creation_or_modification == "creation" else "st_mtime"
 
-    list_of_paths_by_time = copy.deepcopy(list_of_paths)
-    list_of_paths_by_time.sort(key=filter)
+    times = [getattr(os.stat(path_), stat_field) for path_ in list_of_paths]
 
-    is_in_time_order = list_of_paths == list_of_paths_by_time
+    is_in_time_order = all(t1 <= t2 for t1, t2 in zip(times, times[1:]))
 
     return is_in_time_order
 
@@ -174,7 +174,7 @@ def _dump_dict_to_yaml(filepath: Path | str, dict_: dict) -> None:
         filepath,
         "w",
     ) as file_to_save:
-        yaml.dump(dict_, file_to_save, sort_keys=False)
+        yaml.dump(dict_, file_to_save, Dumper=_YamlDumper, sort_keys=False)
 
 
 def _load_dict_from_yaml(filepath: Path | str) -> dict:
@@ -182,5 +182,5 @@ def _load_dict_from_yaml(filepath: Path | str) -> dict:
     Load a dictionary from yaml file.
     """
     with open(filepath, "r") as file:
-        loaded_dict = yaml.safe_load(file)
+        loaded_dict = yaml.load(file.read(), Loader=_ConfigLoader)
     return loaded_dict
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+import math
 from typing import Literal
 
 import matplotlib.pyplot as plt
-import numpy as np
 import spikeinterface.full as si
 
 from spikewrap.configs._backend import canon
@@ -55,8 +55,8 @@ def visualise_run_preprocessed(
     # Setup subplots
     num_recordings = len(all_preprocessed)
 
-    columns = np.ceil(np.sqrt(num_recordings)).astype(int)
-    rows = np.ceil(num_recordings / columns).astype(int)
+    columns = math.isqrt(num_recordings - 1) + 1  # i.e. ceil(sqrt(num_recordings))
+    rows = math.ceil(num_recordings / columns)
 
     fig, axes = plt.subplots(
         rows, columns, figsize=(figsize[0] * columns, figsize[1] * rows), squeeze=False